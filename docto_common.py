@@ -4,17 +4,29 @@ Contient le cache RDVs (indexé par semaine), les constantes ANSI, et les
 fonctions de configuration, cookies et fetch Doctolib communes aux deux scripts.
 """
 
+from collections import OrderedDict
+from collections.abc import Mapping
+import csv
 import datetime
 from datetime import timedelta
+import io
 import json
 import os
 import sys
-from typing import Any
+import types
+from typing import Any, Callable, IO
 
 import browser_cookie3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 
+try:  # Parseur JSON accéléré optionnel.
+    import orjson
+except ImportError:
+    orjson = None
+
 _CACHE_VERSION = 2
 _CACHE_FILE_DEFAULT = 'cache/.heatmap_cache.json'
 
@@ -23,6 +35,32 @@ _ANSI_GREEN = '\033[92m'
 _ANSI_RED = '\033[91m'
 _ANSI_RESET = '\033[0m'
 
+# Cache LRU des fichiers parsés : {chemin: (mtime, taille, contenu)}.
+_FILE_CACHE_MAX = 100
+_FILE_CACHE: 'OrderedDict[str, tuple[float, int, Any]]' = OrderedDict()
+
+# Nombre maximal de requêtes Doctolib simultanées (threads de récupération).
+_MAX_WORKERS = 16
+
+# Session HTTP partagée : réutilise les connexions keep-alive vers Doctolib
+# et rejoue automatiquement les requêtes en cas d'erreur serveur transitoire.
+# Le pool est dimensionné pour _MAX_WORKERS requêtes simultanées.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=_MAX_WORKERS,
+    max_retries=Retry(
+        total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+    ),
+))
+_SESSION.headers.update({'Accept': 'application/json'})
+
+# Parseur YAML natif (libyaml) si disponible, sinon parseur pur Python.
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 
 def load_cache(path: str) -> dict[str, list[dict[str, Any]]]:
     """Charge le cache depuis un fichier JSON.
@@ -72,25 +110,86 @@ def save_cache(
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def load_yaml(path: str) -> dict[str, Any]:
+def _cached_parse(path: str, parse: Callable[[IO[str]], Any]) -> Any:
+    """Parse un fichier texte en mémorisant le résultat par chemin.
+
+    L'entrée en cache est invalidée dès que la date de modification ou la
+    taille du fichier change. L'objet en cache est retourné tel quel :
+    l'appelant ne doit pas le modifier.
+
+    Args:
+        path: Chemin vers le fichier.
+        parse: Fonction recevant le fichier ouvert et retournant son contenu
+            parsé.
+
+    Returns:
+        Le contenu parsé du fichier.
+
+    Raises:
+        FileNotFoundError: Si le fichier est introuvable.
+    """
+    st = os.stat(path)
+    entry = _FILE_CACHE.get(path)
+    if entry is None or entry[:2] != (st.st_mtime, st.st_size):
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = (st.st_mtime, st.st_size, parse(f))
+        _FILE_CACHE[path] = entry
+        if len(_FILE_CACHE) > _FILE_CACHE_MAX:
+            _FILE_CACHE.popitem(last=False)
+    _FILE_CACHE.move_to_end(path)
+    return entry[2]
+
+
+def load_yaml(path: str) -> Mapping[str, Any]:
     """Charge la configuration depuis un fichier YAML.
 
+    Le résultat est mis en cache tant que le fichier n'est pas modifié et
+    retourné en lecture seule, sans copie.
+
     Args:
         path: Chemin vers le fichier de configuration.
 
     Returns:
-        Le contenu du fichier YAML sous forme de dictionnaire.
+        Le contenu du fichier YAML sous forme de mapping en lecture seule.
 
     Raises:
         SystemExit: Si le fichier est introuvable.
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return types.MappingProxyType(_cached_parse(
+            path, lambda f: yaml.load(f, Loader=_YamlLoader)
+        ))
     except FileNotFoundError:
         sys.exit(f'Erreur: Fichier introuvable {path}')
 
 
+def _parse_cookie_file(f: IO[str]) -> dict[str, str]:
+    """Parse un fichier de cookies au format Netscape ou clé=valeur.
+
+    Args:
+        f: Fichier de cookies ouvert en lecture.
+
+    Returns:
+        Dictionnaire {nom: valeur} des cookies.
+    """
+    content = f.read()
+    if '\t' in content:  # Format Netscape (supposé si tabulations présentes).
+        rows = csv.reader(
+            io.StringIO(content), delimiter='\t', quoting=csv.QUOTE_NONE
+        )
+        # Comme l'ancien line.strip() : espaces de fin retirés et lignes à
+        # valeur vide ignorées.
+        return {
+            row[5]: value
+            for row in rows
+            if len(row) >= 7 and not row[0].startswith('#')
+            and (value := row[6].strip())
+        }
+    # Format simple (clé=val; clé=val).
+    pairs = (pair.partition('=') for pair in content.split(';'))
+    return {k.strip(): v.strip() for k, sep, v in pairs if sep}
+
+
 def get_cookies(path: str) -> Any:
     """Charge les cookies Doctolib depuis le navigateur ou un fichier.
 
@@ -140,25 +239,41 @@ def get_cookies(path: str) -> Any:
     if not os.path.exists(path):
         return {}
 
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    return dict(_cached_parse(path, _parse_cookie_file))
 
-    cookies: dict[str, str] = {}
-    if '\t' in content:  # Format Netscape (supposé si tabulations présentes).
-        for line in content.splitlines():
-            parts = line.strip().split('\t')
-            if len(parts) >= 7 and not line.startswith('#'):
-                cookies[parts[5]] = parts[6]
-    else:  # Format simple (clé=val; clé=val).
-        for pair in content.replace('; ', ';').split(';'):
-            if '=' in pair:
-                k, v = pair.split('=', 1)
-                cookies[k] = v
-    return cookies
+
+def _response_data(resp: requests.Response) -> list[dict[str, Any]]:
+    """Décode le champ 'data' d'une réponse JSON Doctolib.
+
+    Utilise orjson s'il est installé, sinon le décodeur de requests. Un
+    corps non JSON (ex. page de connexion HTML après expiration des cookies)
+    est redécodé par requests afin de lever la même exception qu'auparavant.
+
+    Args:
+        resp: Réponse HTTP de l'API Doctolib.
+
+    Returns:
+        Liste des éléments du champ 'data' (vide si absent).
+
+    Raises:
+        requests.exceptions.JSONDecodeError: Si le corps n'est pas du JSON.
+    """
+    payload = None
+    if orjson:
+        # Extension C : pylint ne peut pas en inspecter les membres.
+        # pylint: disable=no-member
+        try:
+            payload = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass
+        # pylint: enable=no-member
+    if payload is None:
+        payload = resp.json()
+    return payload.get('data', [])
 
 
 def fetch_recurring_events(
-        config: dict[str, Any],
+        config: Mapping[str, Any],
         start_date: str,
         cookies: Any,
 ) -> list[dict[str, Any]]:
@@ -187,7 +302,7 @@ def fetch_recurring_events(
         'view': 'week',
     }
 
-    resp = requests.get(
+    resp = _SESSION.get(
         url,
         params=params,
         cookies=cookies,
@@ -195,12 +310,12 @@ def fetch_recurring_events(
         timeout=10,
     )
     resp.raise_for_status()
-    return resp.json().get('data', [])
+    return _response_data(resp)
 
 
 def fetch_doctolib(
-        config: dict[str, Any],
-        start_date: str,
+        config: Mapping[str, Any],
+        start_date: str | datetime.datetime,
         cookies: Any,
 ) -> list[dict[str, Any]]:
     """Récupère les RDV Doctolib pour une semaine donnée, annulations incluses.
@@ -210,7 +325,8 @@ def fetch_doctolib(
 
     Args:
         config: Configuration contenant les paramètres de l'API Doctolib.
-        start_date: Date de début de la semaine au format 'YYYY-MM-DD'.
+        start_date: Date de début de la semaine au format 'YYYY-MM-DD', ou
+            datetime déjà calculé par l'appelant (évite un re-parsing).
         cookies: Cookies d'authentification Doctolib.
 
     Returns:
@@ -221,7 +337,10 @@ def fetch_doctolib(
         requests.RequestException: En cas d'erreur réseau ou HTTP.
     """
     api = config['api']
-    start_dt = datetime.datetime.strptime(start_date, '%Y-%m-%d')
+    start_dt = (
+        start_date if isinstance(start_date, datetime.datetime)
+        else datetime.datetime.strptime(start_date, '%Y-%m-%d')
+    )
     end_dt = start_dt + timedelta(days=7) - timedelta(seconds=1)
 
     params = {
@@ -232,7 +351,7 @@ def fetch_doctolib(
         'include_patients': 'true',
     }
 
-    resp = requests.get(
+    resp = _SESSION.get(
         api['url'],
         params=params,
         cookies=cookies,
@@ -241,15 +360,17 @@ def fetch_doctolib(
     )
     resp.raise_for_status()
 
-    rdvs = []
-    for item in resp.json().get('data', []):
-        status = item.get('status', 'confirmed').lower()
-        rdvs.append({
-            'start': item.get('start_date'),
-            'end': item.get('end_date'),
+    # Une seule passe : filtrage des RDVs sans dates et construction.
+    return [
+        {
+            'start': start,
+            'end': end,
             'new_patient': item.get('new_patient', False),
             'status': status,
             'cancelled': status in ('deleted', 'no_show_but_ok'),
             'created_at': item.get('created_at'),
-        })
-    return [r for r in rdvs if r['start'] and r['end']]
+        }
+        for item in _response_data(resp)
+        if (start := item.get('start_date')) and (end := item.get('end_date'))
+        for status in (item.get('status', 'confirmed').lower(),)
+    ]
@@ -19,6 +19,7 @@ Utilisation :
 """
 
 import argparse
+from collections.abc import Mapping
 import datetime
 from datetime import timedelta
 import os
@@ -115,7 +116,7 @@ def load_future_from_cache(
 
 
 def fetch_all_appointments(
-        config: dict[str, Any],
+        config: Mapping[str, Any],
         cookies: Any,
         week_starts: list[str],
         cache_path: str | None,
@@ -170,7 +171,7 @@ def fetch_all_appointments(
 
 
 def fetch_all_open_periods(
-        config: dict[str, Any],
+        config: Mapping[str, Any],
         cookies: Any,
         week_starts: list[str],
         cache_path: str | None,
@@ -1776,7 +1777,7 @@ def _run_forecast(
         df_all: pd.DataFrame,
         df_conf: pd.DataFrame,
         cache_path: str | None,
-        config: dict[str, Any],
+        config: Mapping[str, Any],
         cookies: Any,
 ) -> None:
     """Génère les analyses prévisionnelles depuis les semaines futures du cache.
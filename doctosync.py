@@ -2,19 +2,30 @@
 """Script de synchronisation Doctolib -> Google Calendar."""
 
 import argparse
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 from datetime import timedelta
+import functools
+import json
+import operator
 import os
+import re
 import sys
+import tempfile
+import threading
 from typing import Any, Optional
 
+import httplib2
 import requests
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from docto_common import (
     _ANSI_BLUE,
@@ -22,6 +33,7 @@ from docto_common import (
     _ANSI_RED,
     _ANSI_RESET,
     _CACHE_FILE_DEFAULT,
+    _MAX_WORKERS,
     fetch_doctolib,
     get_cookies,
     load_cache,
@@ -33,20 +45,99 @@ SCOPES = ['https://www.googleapis.com/auth/calendar']
 
 _TIMEZONE = 'Europe/Paris'
 
-def get_calendar_service(config: dict[str, Any]) -> Any:
-    """Authentifie l'utilisateur et retourne le service Google Calendar.
+# Nombre maximal de requêtes par lot (limite imposée par Google).
+_BATCH_LIMIT = 50
+
+# Extrait la clé de synchronisation de la description d'un événement.
+_SYNC_KEY_RE = re.compile(r'SYNC_KEY:\s*(\S+)')
+
+# Réponse partielle : seuls les champs lus par sync_week (et par la fusion
+# incrémentale : status, start) sont demandés.
+_EVENT_LIST_FIELDS = (
+    'items(id,status,start,description,location,reminders,summary),'
+    'nextPageToken,nextSyncToken'
+)
+
+# Fichier d'état de synchronisation incrémentale (syncToken par semaine).
+_SYNC_STATE_FILE = '.google_sync_state.json'
+
+# Les clients googleapiclient ne sont pas thread-safe : un service par thread.
+_THREAD_LOCAL = threading.local()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials(token_path: str, _mtime: float) -> Credentials:
+    """Lit les identifiants depuis le fichier de jeton.
+
+    Mémoïsé par (chemin, date de modification) : le fichier n'est relu que
+    s'il a changé.
+
+    Args:
+        token_path: Chemin vers le fichier de jeton Google.
+        _mtime: Date de modification du fichier (clé de cache uniquement).
+
+    Returns:
+        Les identifiants Google OAuth lus depuis le fichier.
+    """
+    return Credentials.from_authorized_user_file(token_path, SCOPES)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Écrit un fichier via un fichier temporaire renommé atomiquement.
+
+    Args:
+        path: Chemin du fichier à écrire.
+        data: Contenu à écrire.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or '.', suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_token(token_path: str, content: str) -> None:
+    """Écrit le jeton Google sur disque s'il a changé.
+
+    L'écriture passe par un fichier temporaire renommé atomiquement, afin
+    de ne jamais laisser un jeton tronqué.
+
+    Args:
+        token_path: Chemin vers le fichier de jeton Google.
+        content: Jeton sérialisé en JSON.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(token_path, 'rb') as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+
+    _atomic_write(token_path, data)
+
+
+def get_credentials(config: Mapping[str, Any]) -> Credentials:
+    """Authentifie l'utilisateur et retourne ses identifiants Google.
 
     Args:
         config: Configuration contenant les chemins vers les credentials.
 
     Returns:
-        Un objet service Google Calendar authentifié.
+        Des identifiants Google OAuth valides.
     """
     creds = None
     token_path = config['calendar'].get('token_path', 'config/token.json')
 
     if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+        creds = _load_credentials(
+            token_path, os.path.getmtime(token_path)
+        )
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -57,58 +148,301 @@ def get_calendar_service(config: dict[str, Any]) -> Any:
             )
             creds = flow.run_local_server(port=0)
 
-        with open(token_path, 'w', encoding='utf-8') as token:
-            token.write(creds.to_json())
+        _write_token(token_path, creds.to_json())
 
-    return build('calendar', 'v3', credentials=creds)
+    return creds
 
 
-def fetch_google_events(
+def get_calendar_service(creds: Credentials) -> Any:
+    """Retourne le service Google Calendar propre au thread courant.
+
+    Le document de découverte embarqué dans googleapiclient est utilisé
+    (static_discovery), ce qui évite son téléchargement à chaque démarrage.
+    Le service s'appuie sur un unique AuthorizedHttp par thread (httplib2
+    n'est pas thread-safe), dont la connexion keep-alive est réutilisée par
+    toutes les requêtes du thread.
+
+    Args:
+        creds: Identifiants Google OAuth valides.
+
+    Returns:
+        Un objet service Google Calendar authentifié.
+    """
+    service = getattr(_THREAD_LOCAL, 'service', None)
+    if service is None:
+        # build_http conserve le délai par défaut de googleapiclient et la
+        # gestion des redirections 308.
+        http = AuthorizedHttp(creds, http=build_http())
+        service = build(
+            'calendar', 'v3', http=http,
+            cache_discovery=False, static_discovery=True,
+        )
+        _THREAD_LOCAL.service = service
+    return service
+
+
+def _load_sync_state(path: str) -> dict[str, dict[str, Any]]:
+    """Charge l'état de synchronisation incrémentale Google Calendar.
+
+    Args:
+        path: Chemin vers le fichier d'état JSON.
+
+    Returns:
+        Dictionnaire {calendar_id|semaine: {'token': ..., 'events': {...}}},
+        vide si le fichier est absent ou illisible.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sync_state(path: str, state: dict[str, dict[str, Any]]) -> None:
+    """Persiste l'état de synchronisation incrémentale Google Calendar.
+
+    Args:
+        path: Chemin vers le fichier d'état JSON.
+        state: État à sauvegarder.
+    """
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    _atomic_write(
+        path, json.dumps(state, ensure_ascii=False).encode('utf-8')
+    )
+
+
+def _sync_state_path(cache_path: Optional[str]) -> Optional[str]:
+    """Détermine le chemin de l'état de synchronisation incrémentale.
+
+    L'état est stocké à côté du cache RDVs et désactivé avec lui.
+
+    Args:
+        cache_path: Chemin du cache RDVs, ou None si désactivé.
+
+    Returns:
+        Chemin du fichier d'état, ou None si le cache est désactivé.
+    """
+    if not cache_path:
+        return None
+    return os.path.join(
+        os.path.dirname(cache_path) or 'cache', _SYNC_STATE_FILE
+    )
+
+
+def _prune_sync_state(
+        state: dict[str, dict[str, Any]],
+        monday: datetime.date,
+) -> dict[str, dict[str, Any]]:
+    """Retire de l'état les semaines passées, qui ne seront plus synchronisées.
+
+    Args:
+        state: État de synchronisation {calendar_id|semaine: ...}.
+        monday: Lundi de la semaine courante.
+
+    Returns:
+        L'état restreint à la semaine courante et aux suivantes.
+    """
+    monday_str = monday.strftime('%Y-%m-%d')
+    return {
+        k: v for k, v in state.items() if k.rsplit('|', 1)[1] >= monday_str
+    }
+
+
+def _list_events(
         service: Any,
         calendar_id: str,
-        start_date: str,
+        **params: Any,
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Liste les événements d'un calendrier en suivant la pagination.
+
+    Args:
+        service: Service Google Calendar authentifié.
+        calendar_id: Identifiant du calendrier Google.
+        **params: Paramètres supplémentaires de events().list (fenêtre
+            temporelle ou syncToken).
+
+    Returns:
+        Tuple (événements, nextSyncToken ou None).
+    """
+    events: list[dict[str, Any]] = []
+    page_token = None
+    while True:
+        result = service.events().list(
+            calendarId=calendar_id,
+            singleEvents=True,
+            fields=_EVENT_LIST_FIELDS,
+            maxResults=2500,
+            pageToken=page_token,
+            **params,
+        ).execute()
+        events.extend(result.get('items', []))
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            return events, result.get('nextSyncToken')
+
+
+def _event_sync_key(event: dict[str, Any]) -> Optional[str]:
+    """Extrait la SYNC_KEY de la description d'un événement.
+
+    Args:
+        event: Événement Google Calendar.
+
+    Returns:
+        La SYNC_KEY, ou None si l'événement n'est pas synchronisé.
+    """
+    desc = event.get('description')
+    if not desc:
+        return None
+    match = _SYNC_KEY_RE.search(desc)
+    return match.group(1) if match else None
+
+
+def _merge_event_changes(
+        events: dict[str, dict[str, Any]],
+        changes: list[dict[str, Any]],
+        start_dt: datetime.datetime,
+) -> dict[str, dict[str, Any]]:
+    """Applique un delta incrémental aux événements en cache d'une semaine.
+
+    Le delta couvre tout le calendrier : seuls les événements synchronisés
+    (porteurs d'une SYNC_KEY) débutant dans la semaine sont conservés, les
+    événements supprimés ou déplacés hors de la semaine sont retirés.
+
+    Args:
+        events: Événements en cache de la semaine, indexés par id.
+        changes: Événements modifiés renvoyés avec le syncToken.
+        start_dt: Début de la semaine (lundi à minuit).
+
+    Returns:
+        Les événements de la semaine après application du delta.
+    """
+    win_min = start_dt.replace(tzinfo=datetime.timezone.utc)
+    win_max = win_min + timedelta(days=7)
+    # Filtre aussi l'état existant (fichiers écrits par une version
+    # antérieure qui conservait tous les événements).
+    merged = {k: e for k, e in events.items() if _event_sync_key(e)}
+    for event in changes:
+        merged.pop(event['id'], None)
+        start = event.get('start', {}).get('dateTime')
+        if (event.get('status') != 'cancelled' and start
+                and _event_sync_key(event)
+                and win_min <= datetime.datetime.fromisoformat(start)
+                < win_max):
+            merged[event['id']] = event
+    return merged
+
+
+def fetch_google_events(
+        creds: Credentials,
+        calendar_id: str,
+        start_dt: datetime.datetime,
+        sync_state: Optional[dict[str, dict[str, Any]]] = None,
 ) -> dict[str, Any]:
     """Récupère les événements Google Calendar existants pour une semaine.
 
+    Peut être appelée depuis un thread secondaire : le service utilisé est
+    celui du thread courant.
+
+    Si un syncToken est connu pour la semaine, seules les modifications
+    depuis le dernier appel sont récupérées et fusionnées avec les
+    événements en cache. Un token expiré (410) déclenche une récupération
+    complète.
+
     Args:
-        service: Service Google Calendar authentifié.
+        creds: Identifiants Google OAuth valides.
         calendar_id: Identifiant du calendrier Google.
-        start_date: Date de début de la semaine au format 'YYYY-MM-DD'.
+        start_dt: Début de la semaine (lundi à minuit).
+        sync_state: État de synchronisation incrémentale, mis à jour en
+            place, ou None pour toujours tout récupérer.
 
     Returns:
         Dictionnaire {SYNC_KEY: événement} pour les événements synchronisés.
+
+    Raises:
+        HttpError: En cas d'erreur de l'API Google Calendar.
     """
-    start_dt = datetime.datetime.strptime(start_date, '%Y-%m-%d')
-    t_min = start_dt.replace(hour=0, minute=0, second=0).isoformat() + 'Z'
-    t_max = (
-        (start_dt + timedelta(days=7))
-        .replace(hour=0, minute=0, second=0)
-        .isoformat() + 'Z'
-    )
+    service = get_calendar_service(creds)
+    state_key = f"{calendar_id}|{start_dt.strftime('%Y-%m-%d')}"
+    entry = sync_state.get(state_key) if sync_state is not None else None
 
-    events = (
-        service.events()
-        .list(
-            calendarId=calendar_id,
-            timeMin=t_min,
-            timeMax=t_max,
-            singleEvents=True,
+    events = None
+    token = None
+    if entry:
+        try:
+            changes, token = _list_events(
+                service, calendar_id, syncToken=entry['token']
+            )
+            events = _merge_event_changes(entry['events'], changes, start_dt)
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+
+    if events is None:
+        items, token = _list_events(
+            service,
+            calendar_id,
+            timeMin=start_dt.isoformat() + 'Z',
+            timeMax=(start_dt + timedelta(days=7)).isoformat() + 'Z',
         )
-        .execute()
-        .get('items', [])
-    )
+        # Seuls les événements synchronisés sont conservés : les événements
+        # personnels ne doivent pas être écrits dans l'état sur disque.
+        events = {
+            event['id']: event for event in items if _event_sync_key(event)
+        }
+
+    if sync_state is not None:
+        if token:
+            sync_state[state_key] = {'token': token, 'events': events}
+        else:
+            sync_state.pop(state_key, None)
 
-    mapping = {}
-    for event in events:
-        desc = event.get('description', '')
-        if 'SYNC_KEY:' in desc:
-            mapping[desc.split('SYNC_KEY:')[1].strip()] = event
-    return mapping
+    return {_event_sync_key(event): event for event in events.values()}
+
+
+def _prepare_sync_rdvs(
+        rdvs: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Filtre les RDVs confirmés et précalcule les champs de synchro.
+
+    En une seule passe, ajoute à chaque RDV sa clé de synchronisation
+    ('sync_key'), sa date ('day', 'YYYY-MM-DD') et le titre final de
+    l'événement ('summary_full').
+
+    Plusieurs RDVs sur le même créneau (même début, fin et type) reçoivent
+    une clé suffixée par leur rang ('#2', '#3'...), afin que chacun garde
+    son propre événement Google.
+
+    Args:
+        rdvs: RDVs issus de fetch_doctolib (confirmés et annulés).
+
+    Returns:
+        Liste des RDVs non annulés enrichis.
+    """
+    seen: dict[str, int] = {}
+    prepared = []
+    for r in rdvs:
+        if r['cancelled']:
+            continue
+        key = f"{r['start']}|{r['end']}|{r['new_patient']}"
+        seen[key] = seen.get(key, 0) + 1
+        prepared.append({
+            **r,
+            'sync_key': key if seen[key] == 1 else f'{key}#{seen[key]}',
+            'day': r['start'][:10],
+            'summary_full': (
+                f"{'Nouveau patient' if r['new_patient'] else 'Suivi'} "
+                f"[{r['status']}]"
+            ),
+        })
+    return prepared
 
 
 def _create_event_body(
         rdv: dict[str, Any],
-        key: str,
         notifs: tuple[int, int],
         last_day: Optional[str],
         loc: str,
@@ -116,8 +450,7 @@ def _create_event_body(
     """Crée le corps d'un événement Google Calendar.
 
     Args:
-        rdv: Rendez-vous Doctolib nettoyé.
-        key: Clé unique de synchronisation (SYNC_KEY).
+        rdv: Rendez-vous Doctolib préparé par _prepare_sync_rdvs.
         notifs: Tuple (notif_std, notif_first) — délais de notification en
             minutes (standard, premier RDV du jour).
         last_day: Date du dernier RDV traité ('YYYY-MM-DD') ou None.
@@ -128,12 +461,14 @@ def _create_event_body(
         'YYYY-MM-DD').
     """
     notif_std, notif_first = notifs
-    day = rdv['start'].split('T')[0]
+    day = rdv['day']
     mins = notif_first if (day != last_day and notif_first > 0) else notif_std
 
     body: dict[str, Any] = {
-        'summary': f"{rdv['summary']} [{rdv['status']}]",
-        'description': f'Synchronisé depuis Doctolib. SYNC_KEY: {key}',
+        'summary': rdv['summary_full'],
+        'description': (
+            f"Synchronisé depuis Doctolib. SYNC_KEY: {rdv['sync_key']}"
+        ),
         'start': {'dateTime': rdv['start'], 'timeZone': _TIMEZONE},
         'end': {'dateTime': rdv['end'], 'timeZone': _TIMEZONE},
         'reminders': (
@@ -151,6 +486,27 @@ def _create_event_body(
     return body, day
 
 
+def _reminders_key(
+        reminders: dict[str, Any],
+) -> tuple[bool, tuple[tuple[str, int], ...]]:
+    """Normalise la configuration des rappels pour comparaison.
+
+    Args:
+        reminders: Champ 'reminders' d'un événement Google Calendar.
+
+    Returns:
+        Tuple (useDefault, rappels triés sous forme (méthode, minutes)),
+        indépendant de l'ordre des clés et des rappels.
+    """
+    return (
+        reminders.get('useDefault', False),
+        tuple(sorted(
+            (o['method'], o['minutes'])
+            for o in reminders.get('overrides', [])
+        )),
+    )
+
+
 def _print_sync_stats(
         week_date: str,
         total_rdvs: int,
@@ -188,9 +544,59 @@ def _print_sync_stats(
     )
 
 
+def _execute_batched(
+        service: Any,
+        ops: list[tuple[str, str, Any]],
+        stats: dict[str, int],
+) -> None:
+    """Exécute des mutations Google Calendar par lots (BatchHttpRequest).
+
+    Les opérations sont regroupées par paquets de _BATCH_LIMIT requêtes afin
+    de limiter le nombre d'allers-retours HTTP : créations, mises à jour et
+    suppressions partagent les mêmes lots. Aucun appel n'est effectué si la
+    liste est vide. Les erreurs sont signalées opération par opération sans
+    interrompre le lot.
+
+    Args:
+        service: Service Google Calendar authentifié.
+        ops: Liste de tuples (type, SYNC_KEY, requête) où type est l'une des
+            clés de stats ('add', 'upd', 'del').
+        stats: Compteurs incrémentés pour chaque opération réussie.
+    """
+    if not ops:
+        return
+
+    # Identifiants de requête indépendants de la SYNC_KEY : deux RDVs
+    # identiques produisent la même clé mais doivent rester distincts.
+    kinds: dict[str, tuple[str, str]] = {}
+
+    def _on_done(request_id: str, _response: Any, exception: Any) -> None:
+        kind, key = kinds[request_id]
+        if exception is not None:
+            print(
+                f'{_ANSI_RED}Erreur Google Calendar ({key}): '
+                f'{exception}{_ANSI_RESET}'
+            )
+            return
+        stats[kind] += 1
+
+    batch = service.new_batch_http_request(callback=_on_done)
+    pending = 0
+    for i, (kind, key, request) in enumerate(ops):
+        kinds[str(i)] = (kind, key)
+        batch.add(request, request_id=str(i))
+        pending += 1
+        if pending == _BATCH_LIMIT:
+            batch.execute()
+            batch = service.new_batch_http_request(callback=_on_done)
+            pending = 0
+    if pending:
+        batch.execute()
+
+
 def sync_week(  # pylint: disable=too-many-locals
         service: Any,
-        config: dict[str, Any],
+        config: Mapping[str, Any],
         rdvs: list[dict[str, Any]],
         existing_map: dict[str, Any],
         week_date: str,
@@ -198,12 +604,14 @@ def sync_week(  # pylint: disable=too-many-locals
     """Synchronise une semaine de RDV Doctolib vers Google Calendar.
 
     Crée, met à jour ou supprime les événements selon les différences
-    détectées entre Doctolib et Google Calendar.
+    détectées entre Doctolib et Google Calendar. Les mutations sont envoyées
+    par lots via _execute_batched.
 
     Args:
         service: Service Google Calendar authentifié.
         config: Configuration globale du script.
-        rdvs: Liste des RDV Doctolib pour la semaine.
+        rdvs: Liste des RDV Doctolib pour la semaine, préparés par
+            _prepare_sync_rdvs.
         existing_map: Événements Google existants indexés par SYNC_KEY.
         week_date: Date de début de la semaine au format 'YYYY-MM-DD'.
     """
@@ -212,45 +620,49 @@ def sync_week(  # pylint: disable=too-many-locals
     loc = config['config'].get('localisation', '').strip()
     calendar_id = config['calendar']['id']
 
-    rdvs.sort(key=lambda x: x['start'])
+    rdvs.sort(key=operator.itemgetter('start'))
 
+    # Planification : corps désirés indexés par SYNC_KEY (ordre
+    # chronologique requis pour le rappel du premier RDV du jour).
+    desired: dict[str, dict[str, Any]] = {}
     last_day = None
-    to_delete = set(existing_map.keys())
-    stats = {'add': 0, 'upd': 0}
-
     for rdv in rdvs:
-        key = f"{rdv['start']}|{rdv['end']}|{rdv['new_patient']}"
-        body, last_day = _create_event_body(
-            rdv, key, (notif_std, notif_first), last_day, loc
+        desired[rdv['sync_key']], last_day = _create_event_body(
+            rdv, (notif_std, notif_first), last_day, loc
         )
 
-        if key in existing_map:
-            to_delete.discard(key)
-            event = existing_map[key]
-            if (event.get('location', '').strip() != loc
-                    or event.get('reminders') != body['reminders']):
-                service.events().update(
-                    calendarId=calendar_id,
-                    eventId=event['id'],
-                    body=body,
-                ).execute()
-                stats['upd'] += 1
-        else:
-            service.events().insert(
-                calendarId=calendar_id, body=body
-            ).execute()
-            stats['add'] += 1
+    desired_keys = desired.keys()
+    existing_keys = existing_map.keys()
+    events = service.events()
+    stats = {'add': 0, 'upd': 0, 'del': 0}
+
+    # Exécution : uniquement les différences entre les deux ensembles.
+    ops: list[tuple[str, str, Any]] = [
+        ('add', k, events.insert(calendarId=calendar_id, body=desired[k]))
+        for k in desired_keys - existing_keys
+    ]
+    for k in desired_keys & existing_keys:
+        event = existing_map[k]
+        body = desired[k]
+        if (event.get('location', '').strip() != loc
+                or _reminders_key(event.get('reminders', {}))
+                != _reminders_key(body['reminders'])):
+            ops.append(('upd', k, events.update(
+                calendarId=calendar_id, eventId=event['id'], body=body
+            )))
+    ops.extend(
+        ('del', k, events.delete(
+            calendarId=calendar_id, eventId=existing_map[k]['id']
+        ))
+        for k in existing_keys - desired_keys
+    )
 
-    for k in to_delete:
-        service.events().delete(
-            calendarId=calendar_id,
-            eventId=existing_map[k]['id'],
-        ).execute()
+    _execute_batched(service, ops, stats)
 
-    _print_sync_stats(week_date, len(rdvs), stats, len(to_delete))
+    _print_sync_stats(week_date, len(rdvs), stats, stats['del'])
 
 
-def main() -> None:
+def main() -> None:  # pylint: disable=too-many-locals
     """Point d'entrée principal du script de synchronisation."""
     parser = argparse.ArgumentParser()
     parser.add_argument('-w', '--weeks', type=int, default=1)
@@ -262,7 +674,10 @@ def main() -> None:
     parser.add_argument(
         '--no-cache',
         action='store_true',
-        help='Ne pas écrire dans le cache après la synchro.',
+        help=(
+            'Ne pas écrire dans le cache après la synchro et désactiver la '
+            'synchro incrémentale Google (récupération complète).'
+        ),
     )
     args = parser.parse_args()
 
@@ -277,7 +692,8 @@ def main() -> None:
         )
 
     try:
-        service = get_calendar_service(config)
+        creds = get_credentials(config)
+        service = get_calendar_service(creds)
     except (ValueError, OSError, HttpError) as e:
         sys.exit(f'Erreur Auth Google: {e}')
 
@@ -285,53 +701,83 @@ def main() -> None:
         datetime.date.today()
         - timedelta(days=datetime.date.today().weekday())
     )
+    monday_dt = datetime.datetime.combine(monday, datetime.time())
+    week_dts = [monday_dt + timedelta(weeks=i) for i in range(args.weeks)]
+    calendar_id = config['calendar']['id']
 
     print(f'Synchronisation sur {args.weeks} semaine(s)...')
 
     cache: dict[str, list] = load_cache(cache_path) if cache_path else {}
     cache_updated = False
 
-    for i in range(args.weeks):
-        w_start = (monday + timedelta(weeks=i)).strftime('%Y-%m-%d')
-
-        try:
-            all_rdvs = fetch_doctolib(config, w_start, cookies)
-
-            # Alimente le cache avec les données brutes (annulés inclus).
-            if cache_path:
-                cache[w_start] = all_rdvs
-                cache_updated = True
-
-            # Filtre les RDVs confirmés pour la synchro Google Calendar.
-            sync_rdvs = [
-                {**r, 'summary': 'Nouveau patient' if r['new_patient'] else 'Suivi'}
-                for r in all_rdvs if not r['cancelled']
-            ]
+    sync_state_path = _sync_state_path(cache_path)
+    sync_state = (
+        _load_sync_state(sync_state_path) if sync_state_path else None
+    )
 
-            existing = fetch_google_events(
-                service, config['calendar']['id'], w_start
+    # Les récupérations (Doctolib et Google) de toutes les semaines sont
+    # lancées en parallèle ; les mutations restent séquentielles.
+    with ThreadPoolExecutor(
+            max_workers=min(2 * len(week_dts), _MAX_WORKERS) or 1
+    ) as executor:
+        rdv_futures = [
+            executor.submit(fetch_doctolib, config, w_dt, cookies)
+            for w_dt in week_dts
+        ]
+        google_futures = [
+            executor.submit(
+                fetch_google_events, creds, calendar_id, w_dt, sync_state
             )
-            sync_week(service, config, sync_rdvs, existing, w_start)
-        except requests.RequestException as e:
-            if i == 0:
-                sys.exit(
-                    f'Erreur FATALE: Échec de la connexion Doctolib pour la '
-                    f'semaine {w_start}. Vérifiez les cookies/URL.\n'
-                    f"Détail de l'erreur: {e}"
+            for w_dt in week_dts
+        ]
+
+        for i, (w_dt, rdv_future, google_future) in enumerate(
+                zip(week_dts, rdv_futures, google_futures)
+        ):
+            w_start = w_dt.strftime('%Y-%m-%d')
+
+            try:
+                all_rdvs = rdv_future.result()
+
+                # Alimente le cache avec les données brutes (annulés inclus).
+                if cache_path:
+                    cache[w_start] = all_rdvs
+                    cache_updated = True
+
+                # Filtre les RDVs confirmés pour la synchro Google Calendar.
+                sync_rdvs = _prepare_sync_rdvs(all_rdvs)
+
+                existing = google_future.result()
+                sync_week(service, config, sync_rdvs, existing, w_start)
+            except requests.RequestException as e:
+                if i == 0:
+                    # Inutile d'attendre les récupérations restantes.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    sys.exit(
+                        f'Erreur FATALE: Échec de la connexion Doctolib pour '
+                        f'la semaine {w_start}. Vérifiez les cookies/URL.\n'
+                        f"Détail de l'erreur: {e}"
+                    )
+                print(
+                    f'Erreur semaine {w_start}: Impossible de récupérer les '
+                    f'RDV. Passage à la semaine suivante.\nDétail: {e}'
+                )
+            except (HttpError, httplib2.HttpLib2Error, OSError) as e:
+                # Après RequestException (sous-classe d'OSError) : couvre les
+                # erreurs réseau côté Google (ex. délai dépassé en plein lot).
+                print(
+                    f'Erreur Google Calendar pour la semaine {w_start}: {e}'
                 )
-            print(
-                f'Erreur semaine {w_start}: Impossible de récupérer les RDV.'
-                f' Passage à la semaine suivante.\nDétail: {e}'
-            )
-        except HttpError as e:
-            print(
-                f'Erreur Google Calendar pour la semaine {w_start}: {e}'
-            )
 
     if cache_updated and cache_path:
         save_cache(cache_path, cache)
         print(f'{_ANSI_GREEN}Cache mis à jour : {cache_path}{_ANSI_RESET}')
 
+    if sync_state_path:
+        _save_sync_state(
+            sync_state_path, _prune_sync_state(sync_state, monday)
+        )
+
 
 if __name__ == '__main__':
     main()